@@ -1,10 +1,18 @@
+import asyncio
+import heapq
+import inspect
+import itertools
 import logging
+import threading
 import time
 import warnings
+import weakref
 
 # from memory_profiler import profile as memoryit  # готовый декоратор для замера использования памяти
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from functools import lru_cache, singledispatch, wraps
+from functools import lru_cache, partial, singledispatch, wraps
 
 from colorama import Back, Fore
 
@@ -37,9 +45,111 @@ from colorama import Back, Fore
 """
 
 
+# Обертки ф-й-генераторов, которые сами не являются генераторами, но возвращают генератор.
+# Хранятся отдельно, а не атрибутом, так как @wraps копирует атрибуты во внешние обертки
+_generator_wrappers = weakref.WeakSet()
+
+
+def _is_generator(function) -> bool:
+    """Возвращает ли ф-я генератор"""
+    return inspect.isgeneratorfunction(function) or function in _generator_wrappers
+
+
+class _ReplayBuffer:
+    """Общий буфер повторного воспроизведения результатов генератора.
+
+    Элементы вычисляются лениво по мере запроса любым из читателей и сохраняются,
+    чтобы последующие читатели получали их из буфера.
+    Источник опрашивается под отдельной блокировкой, поэтому чтение уже сохраненных элементов
+    не ждет медленный источник.
+    Буфер хранит не более maxsize элементов: читатель, дошедший до границы,
+    забирает общий источник, остальные продолжают итерацию собственным генератором.
+    """
+
+    def __init__(self, function, args: tuple, kwargs: dict, maxsize: int):
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.maxsize = maxsize
+        self.items = []
+        self.source = None
+        self.handed_off = False
+        self.exhausted = False
+        self.error = None
+        self.lock = threading.Lock()
+        self.producer = threading.Lock()
+
+    def _next(self, index: int) -> tuple:
+        """Элемент с номером index и итератор остальных элементов, если читатель покидает буфер"""
+        with self.lock:
+            if index < len(self.items):
+                return self.items[index], None
+        with self.producer:
+            with self.lock:
+                # Элемент мог быть получен другим читателем, пока ждали источник
+                if index < len(self.items):
+                    return self.items[index], None
+                if self.error is not None:
+                    raise self.error
+                if self.exhausted:
+                    raise StopIteration
+            if not self.handed_off:
+                if self.source is None:
+                    # Новый источник продолжает с первого несохраненного элемента
+                    self.source = itertools.islice(
+                        self.function(*self.args, **self.kwargs), len(self.items), None
+                    )
+                try:
+                    item = next(self.source)
+                except StopIteration:
+                    with self.lock:
+                        self.exhausted, self.source = True, None
+                    raise
+                except Exception as exception:
+                    with self.lock:
+                        self.error, self.source = exception, None
+                    raise
+                except BaseException:
+                    # Прерванный источник (KeyboardInterrupt, SystemExit) не считается исчерпанным
+                    self.source = None
+                    raise
+                if len(self.items) < self.maxsize:
+                    with self.lock:
+                        self.items.append(item)
+                    return item, None
+                rest, self.source, self.handed_off = self.source, None, True
+                return item, rest
+        # Источник уже отдан: собственный генератор создается и прокручивается вне блокировки
+        rest = itertools.islice(self.function(*self.args, **self.kwargs), index, None)
+        return next(rest), rest
+
+    def __iter__(self):
+        index = 0
+        while True:
+            try:
+                item, rest = self._next(index)
+            except StopIteration:
+                return
+            yield item
+            if rest is not None:
+                yield from rest
+                return
+            index += 1
+
+
 def logger(function):
     """Регистрация начала и окончания выполнения функции"""
 
+    if _is_generator(function):
+
+        @wraps(function)
+        def generator_wrapper(*args, **kwargs):
+            print(f"{function.__name__}: start")
+            yield from function(*args, **kwargs)
+            print(f"{function.__name__}: end")
+
+        return generator_wrapper
+
     @wraps(function)
     def wrapper(*args, **kwargs):
         """wrapper documentation"""
@@ -178,6 +288,30 @@ def timeit(rnd: int = 4):
     assert isinstance(rnd, int)
 
     def decorator(function):
+        if _is_generator(function):
+
+            @wraps(function)
+            def generator_wrapper(*args, **kwargs):
+                count = 0
+                tic = time.perf_counter()
+                try:
+                    for item in function(*args, **kwargs):
+                        count += 1
+                        yield item
+                finally:
+                    elapsed_time = time.perf_counter() - tic
+                    throughput = (
+                        count / elapsed_time if elapsed_time > 0 else float("inf")
+                    )
+                    print(
+                        Fore.YELLOW
+                        + f'"{function.__name__}" elapsed {round(elapsed_time, rnd)} seconds, '
+                        + f"{count} items, {round(throughput, rnd)} items/second"
+                        + Fore.RESET
+                    )
+
+            return generator_wrapper
+
         @wraps(function)
         def wrapper(*args, **kwargs):
             tic = time.perf_counter()
@@ -196,17 +330,263 @@ def timeit(rnd: int = 4):
     return decorator
 
 
-def delay(t: int):
-    """Задержка выполнения ф-и"""
+class _TimerHandle:
+    """Отложенный вызов планировщика"""
+
+    __slots__ = ("when", "callback", "scheduler", "scheduled", "cancelled")
+
+    def __init__(self, when: float, callback, scheduler):
+        self.when = when
+        self.callback = callback
+        self.scheduler = scheduler
+        self.scheduled = True
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.scheduler.cancel(self)
+
+
+class _Scheduler:
+    """Планировщик отложенных вызовов на куче с одним потоком.
+
+    Поток планировщика только отсчитывает время и передает готовые вызовы в пул потоков,
+    поэтому ожидание не занимает рабочие потоки.
+    Отмененные таймеры удаляются лениво, а когда их становится больше половины, куча перестраивается.
+    """
+
+    # Минимальный размер кучи для перестроения (как в asyncio)
+    MIN_HEAP_SIZE = 100
+
+    def __init__(self):
+        self.heap = []
+        self.cancelled_count = 0
+        self.counter = itertools.count()
+        self.condition = threading.Condition()
+        self.thread = None
+        self.executor = None
+
+    def call_later(self, t: int | float, callback) -> _TimerHandle:
+        """Вызов callback в потоке планировщика через t секунд"""
+        handle = _TimerHandle(time.monotonic() + t, callback, self)
+        with self.condition:
+            heapq.heappush(self.heap, (handle.when, next(self.counter), handle))
+            if self.thread is None:
+                self.thread = threading.Thread(
+                    target=self._run, name="decorators-scheduler", daemon=True
+                )
+                self.thread.start()
+            if self.heap[0][2] is handle:
+                self.condition.notify()
+        return handle
+
+    def cancel(self, handle: _TimerHandle) -> None:
+        """Отмена отложенного вызова"""
+        with self.condition:
+            if handle.cancelled:
+                return
+            handle.cancelled, handle.callback = True, None
+            if not handle.scheduled:
+                return
+            self.cancelled_count += 1
+            if len(self.heap) > self.MIN_HEAP_SIZE and self.cancelled_count * 2 > len(
+                self.heap
+            ):
+                self.heap = [entry for entry in self.heap if not entry[2].cancelled]
+                heapq.heapify(self.heap)
+                self.cancelled_count = 0
+
+    def submit(self, function, *args, **kwargs) -> Future:
+        """Выполнение ф-и в пуле потоков"""
+        with self.condition:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(thread_name_prefix="decorators")
+        return self.executor.submit(function, *args, **kwargs)
+
+    def _run(self) -> None:
+        while True:
+            with self.condition:
+                while True:
+                    while self.heap and self.heap[0][2].cancelled:
+                        heapq.heappop(self.heap)[2].scheduled = False
+                        self.cancelled_count -= 1
+                    if not self.heap:
+                        self.condition.wait()
+                        continue
+                    timeout = self.heap[0][0] - time.monotonic()
+                    if timeout <= 0:
+                        handle = heapq.heappop(self.heap)[2]
+                        handle.scheduled = False
+                        callback = handle.callback
+                        break
+                    self.condition.wait(timeout)
+            try:
+                callback()
+            except Exception:
+                logging.getLogger(__name__).exception("scheduled callback failed")
+
+
+_scheduler = _Scheduler()
+
+
+def _new_future(asynchronous: bool):
+    """Future для результата отложенного вызова"""
+    if asynchronous:
+        return asyncio.get_running_loop().create_future()
+    return Future()
+
+
+def _call_later(t: int | float, callback, asynchronous: bool):
+    """Отложенный вызов callback: в цикле asyncio или в планировщике"""
+    if asynchronous:
+        return asyncio.get_running_loop().call_later(t, callback)
+    return _scheduler.call_later(t, callback)
+
+
+def _is_pending(future, asynchronous: bool) -> bool:
+    """Относится ли future к текущей серии вызовов: серия asyncio не переживает свой цикл"""
+    if future is None:
+        return False
+    return not asynchronous or future.get_loop() is asyncio.get_running_loop()
+
+
+def _run_into(future: Future, function, args: tuple, kwargs: dict) -> None:
+    """Выполнение ф-и с записью результата в future"""
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        future.set_result(function(*args, **kwargs))
+    except Exception as exception:
+        future.set_exception(exception)
+
+
+def _copy_result(future, task) -> None:
+    """Перенос результата задачи asyncio в future"""
+    if future.done():
+        return
+    if task.cancelled():
+        future.cancel()
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
+
+
+def _execute(future, function, args: tuple, kwargs: dict, asynchronous: bool) -> None:
+    """Запуск ф-и без блокировки вызывающего с передачей результата в future"""
+    if future.done():
+        return
+    if asynchronous:
+        task = asyncio.get_running_loop().create_task(function(*args, **kwargs))
+        task.add_done_callback(partial(_copy_result, future))
+        future.add_done_callback(lambda f: task.cancel() if f.cancelled() else None)
+    else:
+        _scheduler.submit(_run_into, future, function, args, kwargs)
+
+
+def delay(t: int | float):
+    """Задержка выполнения ф-и без блокировки вызывающего: возвращает future результата.
+    Для корутин используется цикл asyncio, для обычных ф-й - общий планировщик"""
+
+    assert isinstance(t, (int, float)) and t >= 0
+
+    def decorator(function):
+        asynchronous = inspect.iscoroutinefunction(function)
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            future = _new_future(asynchronous)
+            handle = _call_later(
+                t,
+                partial(_execute, future, function, args, kwargs, asynchronous),
+                asynchronous,
+            )
+            future.add_done_callback(lambda f: handle.cancel())
+            return future
+
+        return wrapper
+
+    return decorator
+
+
+def debounce(t: int | float):
+    """Объединение серии вызовов в одно выполнение через t секунд после последнего вызова.
+    Все вызовы серии возвращают общий future, ф-я вызывается с последними аргументами"""
 
-    assert isinstance(t, int)
+    assert isinstance(t, (int, float)) and t > 0
 
     def decorator(function):
+        asynchronous = inspect.iscoroutinefunction(function)
+        lock = threading.Lock()
+        future, call, handle, generation = None, None, None, 0
+
+        def fire(scheduled: int):
+            nonlocal future, call, handle
+            with lock:
+                if scheduled != generation:
+                    return
+                pending, (args, kwargs) = future, call
+                future, call, handle = None, None, None
+            _execute(pending, function, args, kwargs, asynchronous)
+
         @wraps(function)
         def wrapper(*args, **kwargs):
-            time.sleep(t)
-            result = function(*args, **kwargs)
-            return result
+            nonlocal future, call, handle, generation
+            with lock:
+                if handle is not None:
+                    handle.cancel()
+                if not _is_pending(future, asynchronous) or future.done():
+                    future = _new_future(asynchronous)
+                call = (args, kwargs)
+                generation += 1
+                handle = _call_later(t, partial(fire, generation), asynchronous)
+                return future
+
+        return wrapper
+
+    return decorator
+
+
+def throttle(t: int | float):
+    """Выполнение ф-и не чаще одного раза в t секунд.
+    Вызовы в течение интервала объединяются в одно выполнение в его конце с последними аргументами
+    """
+
+    assert isinstance(t, (int, float)) and t > 0
+
+    def decorator(function):
+        asynchronous = inspect.iscoroutinefunction(function)
+        lock = threading.Lock()
+        future, call, last_time_called, generation = None, None, float("-inf"), 0
+
+        def fire(scheduled: int):
+            nonlocal future, call, last_time_called
+            with lock:
+                if scheduled != generation or future is None:
+                    return
+                pending, (args, kwargs) = future, call
+                future, call, last_time_called = None, None, time.monotonic()
+            _execute(pending, function, args, kwargs, asynchronous)
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            nonlocal future, call, last_time_called, generation
+            with lock:
+                if _is_pending(future, asynchronous):
+                    # Отмененный future серии заменяется новым, выполнение в конце интервала остается
+                    if future.done():
+                        future = _new_future(asynchronous)
+                    call = (args, kwargs)
+                    return future
+                current = _new_future(asynchronous)
+                left_to_wait = last_time_called + t - time.monotonic()
+                if left_to_wait > 0:
+                    future, call = current, (args, kwargs)
+                    generation += 1
+                    _call_later(left_to_wait, partial(fire, generation), asynchronous)
+                    return current
+                last_time_called = time.monotonic()
+            _execute(current, function, args, kwargs, asynchronous)
+            return current
 
         return wrapper
 
@@ -214,7 +594,36 @@ def delay(t: int):
 
 
 def cache(function):
-    """Кэширование ф-и"""
+    """Кэширование ф-и.
+    Результаты ф-и-генератора материализуются лениво в буферы: не более wrapper.maxsize элементов на набор аргументов
+    и не более wrapper.maxkeys наборов аргументов с вытеснением давно не используемых.
+    Элементы сверх wrapper.maxsize не кэшируются: читатели, дошедшие до границы, повторно вызывают ф-ю
+    """
+
+    if _is_generator(function):
+        lock = threading.Lock()
+
+        @wraps(function)
+        def generator_wrapper(*args, **kwargs):
+            cache_key = args + tuple(kwargs.items())
+            with lock:
+                buffer = generator_wrapper.cache.get(cache_key)
+                if buffer is None or buffer.error is not None:
+                    buffer = _ReplayBuffer(
+                        function, args, kwargs, generator_wrapper.maxsize
+                    )
+                    generator_wrapper.cache[cache_key] = buffer
+                    while len(generator_wrapper.cache) > generator_wrapper.maxkeys:
+                        generator_wrapper.cache.popitem(last=False)
+                else:
+                    generator_wrapper.cache.move_to_end(cache_key)
+            return iter(buffer)
+
+        generator_wrapper.cache = OrderedDict()
+        generator_wrapper.maxsize = 10_000
+        generator_wrapper.maxkeys = 128
+        _generator_wrappers.add(generator_wrapper)
+        return generator_wrapper
 
     @wraps(function)
     def wrapper(*args, **kwargs):
@@ -233,6 +642,21 @@ def cache(function):
 def countcall(function):
     """Подсчитывает количество вызовов функции"""
 
+    if _is_generator(function):
+
+        def iterate(generator, count: int):
+            yield from generator
+            print(f"{function.__name__} has been called {count} times")
+
+        @wraps(function)
+        def generator_wrapper(*args, **kwargs):
+            generator_wrapper.count += 1
+            return iterate(function(*args, **kwargs), generator_wrapper.count)
+
+        generator_wrapper.count = 0
+        _generator_wrappers.add(generator_wrapper)
+        return generator_wrapper
+
     @wraps(function)
     def wrapper(*args, **kwargs):
         wrapper.count += 1
@@ -1,9 +1,25 @@
+import asyncio
+import inspect
+import threading
 import time
 
 import pytest
 from colorama import Back, Fore
 
-from decorators import deprecated, enforce_kwargs, ignore_extra_kwargs, logger, timeit
+from decorators import (
+    cache,
+    countcall,
+    debounce,
+    delay,
+    deprecated,
+    enforce_kwargs,
+    ignore_extra_kwargs,
+    logger,
+    repeat,
+    throttle,
+    timeit,
+)
+from decorators.decorators import _scheduler
 
 
 def test_logger(capsys):
@@ -35,6 +51,25 @@ def test_logger(capsys):
     assert captured.out == "mock_func: start\nmock_func: end\n"
 
 
+def test_logger_generator(capsys):
+    @logger
+    def numbers(n: int):
+        """Генерирует числа."""
+        yield from range(n)
+
+    # Проверка, что начало регистрируется при старте итерации, а окончание - при исчерпании
+    generator = numbers(3)
+    assert capsys.readouterr().out == ""
+    assert next(generator) == 0
+    assert capsys.readouterr().out == "numbers: start\n"
+    assert list(generator) == [1, 2]
+    assert capsys.readouterr().out == "numbers: end\n"
+
+    # Проверка сохранения метаданных функции
+    assert numbers.__name__ == "numbers"
+    assert numbers.__doc__ == "Генерирует числа."
+
+
 def test_deprecated(capsys):
     test_message = "This function is deprecated"
 
@@ -130,6 +165,174 @@ def test_timeit(capsys):
     assert pytest.approx(sleep_time, abs=0.05) == float(time_str)
 
 
+def test_timeit_generator(capsys):
+    @timeit(3)
+    def slow_numbers(n: int):
+        for i in range(n):
+            time.sleep(0.05)
+            yield i
+
+    # Тест проверяет, что измеряется вся итерация, а не создание генератора
+    generator = slow_numbers(4)
+    assert capsys.readouterr().out == ""
+    assert list(generator) == [0, 1, 2, 3]
+    captured = capsys.readouterr()
+    time_str = captured.out.split("elapsed ")[1].split(" seconds")[0]
+    assert pytest.approx(0.2, abs=0.05) == float(time_str)
+    assert "4 items" in captured.out
+    assert "items/second" in captured.out
+
+    # Тест проверяет вывод при досрочном закрытии генератора
+    generator = slow_numbers(4)
+    next(generator)
+    generator.close()
+    assert "1 items" in capsys.readouterr().out
+
+
+def test_cache_generator():
+    calls = []
+
+    @cache
+    def numbers(n: int):
+        calls.append(n)
+        for i in range(n):
+            calls.append(i)
+            yield i
+
+    # Тест проверяет, что элементы вычисляются лениво и воспроизводятся из буфера
+    first = numbers(3)
+    second = numbers(3)
+    assert next(first) == 0
+    assert calls == [3, 0]
+    assert next(second) == 0
+    assert calls == [3, 0]
+    assert list(first) == [1, 2]
+    assert list(second) == [1, 2]
+    assert list(numbers(3)) == [0, 1, 2]
+    assert calls == [3, 0, 1, 2]
+
+    # Тест проверяет ограничение размера буфера
+    numbers.maxsize = 2
+    assert list(numbers(5)) == [0, 1, 2, 3, 4]
+    assert len(numbers.cache[(5,)].items) == 2
+    assert list(numbers(5)) == [0, 1, 2, 3, 4]
+
+    # Тест проверяет, что ошибка генератора не кэшируется навсегда
+    fails = [True]
+
+    @cache
+    def unstable():
+        yield 1
+        if fails[0]:
+            raise RuntimeError("fail")
+        yield 2
+
+    with pytest.raises(RuntimeError):
+        list(unstable())
+    fails[0] = False
+    assert list(unstable()) == [1, 2]
+
+    # Тест проверяет, что источник длиной ровно maxsize не перезапускается
+    starts = []
+
+    @cache
+    def exact():
+        starts.append("start")
+        yield from range(3)
+
+    exact.maxsize = 3
+    assert list(exact()) == [0, 1, 2]
+    assert list(exact()) == [0, 1, 2]
+    assert starts == ["start"]
+
+    # Тест проверяет вытеснение давно не используемых буферов
+    numbers.maxkeys = 2
+    list(numbers(1)), list(numbers(2)), list(numbers(3))
+    assert list(numbers.cache) == [(2,), (3,)]
+
+    # Тест проверяет, что чтение сохраненных элементов не ждет медленный источник
+    release = threading.Event()
+
+    @cache
+    def slow():
+        yield 0
+        release.wait(timeout=1)
+        yield 1
+
+    first = slow()
+    assert next(first) == 0
+    waiting = threading.Thread(target=next, args=(first,))
+    waiting.start()
+    time.sleep(0.05)
+    tic = time.perf_counter()
+    assert next(slow()) == 0
+    assert time.perf_counter() - tic < 0.5
+    release.set()
+    waiting.join()
+
+    # Тест проверяет, что прерванный источник не кэшируется как исчерпанный
+    interrupts = [True]
+
+    @cache
+    def interrupted():
+        yield 1
+        if interrupts[0]:
+            interrupts[0] = False
+            raise KeyboardInterrupt
+        yield 2
+
+    with pytest.raises(KeyboardInterrupt):
+        list(interrupted())
+    assert list(interrupted()) == [1, 2]
+    assert list(interrupted()) == [1, 2]
+
+    # Тест проверяет, что читатели за границей буфера не ждут друг друга
+    @cache
+    def long():
+        for i in range(3):
+            time.sleep(0.1)
+            yield i
+
+    long.maxsize = 1
+    list(long())
+    tic = time.perf_counter()
+    threads = [threading.Thread(target=list, args=(long(),)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.perf_counter() - tic < 0.6
+
+
+def test_generator_stacks():
+    def numbers():
+        yield from range(3)
+
+    # Тест проверяет, что обертки, не возвращающие генератор, сохраняют тип результата
+    assert isinstance(timeit()(repeat(2)(numbers))(), tuple)
+    assert inspect.isgenerator(logger(delay(0.01)(numbers))().result(timeout=1))
+    assert inspect.isgenerator(countcall(delay(0.01)(numbers))().result(timeout=1))
+    assert inspect.isgenerator(delay(0.01)(cache(numbers))().result(timeout=1))
+
+    # Тест проверяет, что генераторные обертки распознаются внешними декораторами
+    assert list(timeit()(cache(numbers))()) == [0, 1, 2]
+    assert list(logger(countcall(numbers))()) == [0, 1, 2]
+
+
+def test_countcall_generator(capsys):
+    @countcall
+    def numbers(n: int):
+        yield from range(n)
+
+    # Тест проверяет подсчет вызовов в момент вызова и вывод по исчерпании генератора
+    first, second = numbers(2), numbers(3)
+    assert numbers.count == 2
+    assert list(first) == [0, 1]
+    assert capsys.readouterr().out == "numbers has been called 1 times\n"
+    assert list(second) == [0, 1, 2]
+    assert capsys.readouterr().out == "numbers has been called 2 times\n"
+
+
 def test_enforce_kwargs():
     # Тестируемые функции
     @enforce_kwargs
@@ -219,3 +422,158 @@ def test_ignore_extra_kwargs():
 
     assert no_kwargs_func(5, 3) == 2
     assert no_kwargs_func(x=10, y=2, z=123) == 8  # `z` игнорируется
+
+
+def test_delay():
+    @delay(0.1)
+    def add(a: int, b: int) -> int:
+        """Складывает два числа."""
+        return a + b
+
+    # Тест проверяет, что вызов не блокируется и возвращает future
+    tic = time.perf_counter()
+    future = add(2, 3)
+    assert time.perf_counter() - tic < 0.05
+    assert not future.done()
+    assert future.result(timeout=1) == 5
+    assert time.perf_counter() - tic >= 0.1
+
+    # Тест проверяет сохранение метаданных функции
+    assert add.__name__ == "add"
+    assert add.__doc__ == "Складывает два числа."
+
+    # Тест проверяет отмену отложенного вызова
+    calls = []
+
+    @delay(0.05)
+    def record():
+        calls.append(1)
+
+    futures = [record() for _ in range(1000)]
+    for future in futures[1:]:
+        assert future.cancel()
+    futures[0].result(timeout=1)
+    time.sleep(0.05)
+    assert calls == [1]
+
+    # Тест проверяет передачу исключения в future
+    @delay(0.01)
+    def fail():
+        raise ValueError("fail")
+
+    with pytest.raises(ValueError):
+        fail().result(timeout=1)
+
+    with pytest.raises(AssertionError):
+
+        @delay(-1)
+        def bad_func():
+            pass
+
+
+def test_delay_async():
+    @delay(0.05)
+    async def add(a: int, b: int) -> int:
+        return a + b
+
+    async def main():
+        future = add(2, 3)
+        assert not future.done()
+        return await future
+
+    assert asyncio.run(main()) == 5
+
+
+def test_debounce():
+    calls = []
+    event = threading.Event()
+
+    @debounce(0.05)
+    def record(x):
+        calls.append(x)
+        event.set()
+        return x
+
+    # Тест проверяет, что серия вызовов объединяется в одно выполнение с последними аргументами
+    futures = [record(i) for i in range(10)]
+    assert all(future is futures[0] for future in futures)
+    assert futures[0].result(timeout=1) == 9
+    assert calls == [9]
+
+    # Тест проверяет, что новая серия выполняется отдельно
+    assert record(10).result(timeout=1) == 10
+    assert calls == [9, 10]
+
+    # Тест проверяет, что отмененные таймеры не копятся в куче планировщика
+    @debounce(60)
+    def idle():
+        pass
+
+    size = len(_scheduler.heap)
+    for _ in range(10_000):
+        idle()
+    assert len(_scheduler.heap) - size < 1_000
+
+
+def test_throttle():
+    calls = []
+
+    @throttle(0.1)
+    def record(x):
+        calls.append(x)
+        return x
+
+    # Тест проверяет выполнение первого вызова сразу и объединение остальных в конце интервала
+    first = record(0)
+    assert first.result(timeout=1) == 0
+    futures = [record(i) for i in range(1, 10)]
+    assert all(future is futures[0] for future in futures)
+    assert not futures[0].done()
+    assert futures[0].result(timeout=1) == 9
+    assert calls == [0, 9]
+
+    # Тест проверяет, что отмена future серии не теряет последующие вызовы интервала
+    time.sleep(0.1)
+    record(10).result(timeout=1)
+    cancelled = record(11)
+    assert cancelled.cancel()
+    future = record(12)
+    assert future is not cancelled
+    assert future.result(timeout=1) == 12
+    assert calls == [0, 9, 10, 12]
+
+
+def test_debounce_throttle_async():
+    calls = []
+
+    @debounce(0.05)
+    async def debounced(x):
+        calls.append(x)
+        return x
+
+    @throttle(0.05)
+    async def throttled(x):
+        return x
+
+    async def main():
+        futures = [debounced(i) for i in range(5)]
+        assert await futures[0] == 4
+        assert await throttled(0) == 0
+        futures = [throttled(i) for i in range(1, 5)]
+        assert await futures[0] == 4
+
+    asyncio.run(main())
+    assert calls == [4]
+
+    # Тест проверяет, что серия, прерванная завершением цикла, не ломает следующий цикл
+    async def interrupted():
+        debounced(5)
+        throttled(5)
+
+    async def next_loop():
+        assert await debounced(6) == 6
+        assert await throttled(6) == 6
+
+    asyncio.run(interrupted())
+    asyncio.run(next_loop())
+    assert calls == [4, 6]